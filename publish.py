@@ -7,15 +7,20 @@ import subprocess
 import sys
 import os
 import argparse
+import glob
+import importlib.util
+import shlex
+import shutil
 from pathlib import Path
 
 
 def run_command(cmd, check=True):
-    """Run a shell command and return output."""
-    print(f"Running: {cmd}")
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+    """Run a command without a shell, streaming its output to the terminal."""
+    args = shlex.split(cmd) if isinstance(cmd, str) else list(cmd)
+    print(f"Running: {' '.join(args)}")
+    result = subprocess.run(args, check=False)
     if check and result.returncode != 0:
-        print(f"Error: {result.stderr}")
+        print(f"Error: command exited with code {result.returncode}")
         sys.exit(result.returncode)
     return result
 
@@ -23,13 +28,20 @@ def run_command(cmd, check=True):
 def clean_build():
     """Clean build artifacts."""
     print("\n=== Cleaning build artifacts ===")
-    run_command("rm -rf build/ dist/ *.egg-info", check=False)
+    for pattern in ("build", "dist", "*.egg-info"):
+        for path in glob.glob(pattern):
+            shutil.rmtree(path, ignore_errors=True)
 
 
 def run_tests():
     """Run package tests."""
     print("\n=== Running tests ===")
-    run_command("python -m pytest tests/ -v")
+    command = "python -m pytest tests/ -v"
+    # Parallelize across test files only when pytest-xdist is installed
+    # (install_dependencies() adds it for --all/--release).
+    if importlib.util.find_spec("xdist") is not None:
+        command += " -n auto --dist=loadfile"
+    run_command(command)
 
 
 def build_package():
@@ -41,13 +53,13 @@ def build_package():
 def upload_to_testpypi():
     """Upload package to TestPyPI."""
     print("\n=== Uploading to TestPyPI ===")
-    run_command("python -m twine upload --repository testpypi dist/*")
+    run_command(["python", "-m", "twine", "upload", "--repository", "testpypi"] + glob.glob("dist/*"))
 
 
 def upload_to_pypi():
     """Upload package to PyPI."""
     print("\n=== Uploading to PyPI ===")
-    run_command("python -m twine upload dist/*")
+    run_command(["python", "-m", "twine", "upload"] + glob.glob("dist/*"))
 
 
 def check_environment():
@@ -72,7 +84,7 @@ def install_dependencies():
     """Install required dependencies."""
     print("\n=== Installing dependencies ===")
     run_command("pip install -r requirements.txt")
-    run_command("pip install build twine pytest")
+    run_command("pip install build twine pytest pytest-xdist")
 
 
 def main():
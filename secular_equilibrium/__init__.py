@@ -4,9 +4,11 @@ Radioactive Decay Chain Secular Equilibrium Calculation Package
 """
 
 from .calculator import (
+    ParentResult,
+    PathInfo,
     SecularEquilibriumCalculator,
     calculate_secular_equilibrium
 )
 
 __version__ = "1.1.1"
-__all__ = ["SecularEquilibriumCalculator", "calculate_secular_equilibrium"]
+__all__ = ["ParentResult", "PathInfo", "SecularEquilibriumCalculator", "calculate_secular_equilibrium"]
@@ -5,11 +5,198 @@ This package calculates parent nuclide activities and masses from measured
 progeny activities, assuming secular equilibrium conditions.
 """
 
+import functools
 import math
-from typing import Dict, List, Optional
+import operator
+import re
+import sys
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
+import numpy as np
 import radioactivedecay as rd
 
+_LN2 = math.log(2.0)
+_SECONDS_PER_YEAR = 365.25 * 86400.0
+_AVOGADRO = 6.02214076e23
+
+# dataclass(slots=True) is only available on Python 3.10+.
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+class _ChainPath(NamedTuple):
+    """Acyclic decay path from a parent to a progeny, independent of decay_type."""
+
+    nodes: List[str]
+    decay_modes: List[str]
+    step_branching_fractions: List[float]
+    chain_branching_ratio: float
+
+
+class PathInfo(NamedTuple):
+    """
+    Contribution of one decay path to a parent's branching ratio.
+
+    Fields can also be read by name as with the dicts used by earlier releases:
+    path['nodes'], path.get('nodes'), 'nodes' in path and path.keys(). Iteration
+    and JSON encoding see a tuple; use path._asdict() for a plain dict.
+    """
+
+    nodes: List[str]
+    decay_modes: List[str]
+    step_branching_fractions: List[float]
+    chain_branching_ratio: float
+    decay_type_fraction_at_measured: float
+    path_branching_ratio: float
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._fields
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the field value, or default when the field is unknown."""
+        return getattr(self, key) if key in self._fields else default
+
+    def keys(self) -> Tuple[str, ...]:
+        """Return the field names, as dict.keys() did for earlier releases."""
+        return self._fields
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class ParentResult:
+    """
+    Calculation result for one parent nuclide.
+
+    Fields that do not apply to a result (e.g. uncertainties when no measured
+    uncertainty was given, or paths when include_paths is False) are None.
+    For backwards compatibility the result also supports the read-only dict
+    protocol used by earlier releases: result['mass_g'], result.get('error'),
+    and 'paths' in result (True only for fields that are set).
+    """
+
+    activity_Bq: float
+    mass_g: float
+    branching_ratio: float
+    halflife_yr: float
+    atomic_mass: Optional[float] = None
+    error: Optional[str] = None
+    activity_uncertainty_Bq: Optional[float] = None
+    mass_uncertainty_g: Optional[float] = None
+    relative_uncertainty: Optional[float] = None
+    paths: Optional[List[PathInfo]] = None
+    total_branching_ratio: Optional[float] = None
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _PARENT_RESULT_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _PARENT_RESULT_FIELDS and getattr(self, key) is not None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the field value, or default when the field is unknown or unset."""
+        value = getattr(self, key, None) if key in _PARENT_RESULT_FIELDS else None
+        return default if value is None else value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the set fields as a plain dict (the pre-ParentResult format)."""
+        result = {name: getattr(self, name) for name in _PARENT_RESULT_FIELDS if getattr(self, name) is not None}
+        if self.paths is not None:
+            result['paths'] = [dict(path._asdict()) for path in self.paths]
+        return result
+
+
+_PARENT_RESULT_FIELDS = tuple(field.name for field in fields(ParentResult))
+
+
+class _NuclideInfo(NamedTuple):
+    """Decay data of a nuclide, fetched once from radioactivedecay."""
+
+    nuclide: rd.Nuclide
+    decay_modes: Tuple[str, ...]
+    branching_fractions: Tuple[float, ...]
+    progeny: Tuple[str, ...]
+    halflife_s: float
+    atomic_mass: float
+    decay_type_fractions: Dict[str, float]
+
+
+@functools.lru_cache(maxsize=4096)
+def _nuclide_info(name: str) -> _NuclideInfo:
+    """
+    Return cached decay data for a nuclide.
+
+    Raises the radioactivedecay error for invalid names (errors are not cached).
+    """
+    nuclide = rd.Nuclide(name)
+    decay_modes = tuple(nuclide.decay_modes())
+    branching_fractions = tuple(nuclide.branching_fractions())
+
+    # Summed branching fraction of all modes containing each decay type (e.g. 'β-n' counts for 'β-').
+    decay_type_fractions = dict.fromkeys(SecularEquilibriumCalculator.VALID_DECAY_TYPES, 0.0)
+    for mode, fraction in zip(decay_modes, branching_fractions):
+        for decay_type in decay_type_fractions:
+            if decay_type in mode:
+                decay_type_fractions[decay_type] += fraction
+
+    return _NuclideInfo(
+        nuclide=nuclide,
+        decay_modes=decay_modes,
+        branching_fractions=branching_fractions,
+        progeny=tuple(nuclide.progeny()),
+        halflife_s=nuclide.half_life('s'),
+        atomic_mass=nuclide.atomic_mass,
+        decay_type_fractions=decay_type_fractions,
+    )
+
+
+_valid_nuclide_cache: Dict[str, bool] = {}
+
+# Enumerated decay paths by (parent, progeny, max_depth, min_path_ratio); shared by all
+# calculator instances since paths do not depend on decay_type.
+_chain_paths_cache: Dict[Tuple[str, str, int, float], List[_ChainPath]] = {}
+
+# Canonical radioactivedecay nuclide token, e.g. 'U-238', 'Pa-234m', 'Ir-192n'.
+_NUCLIDE_RE = re.compile(r'^[A-Z][a-z]?-\d{1,3}[mn]?\d?$')
+
+
+def _is_valid_nuclide(name: str) -> bool:
+    """
+    Return True when a decay child token is a nuclide known to radioactivedecay.
+
+    Tokens that are not in canonical form (e.g. 'SF') are rejected by a regex
+    without constructing a Nuclide; other results are memoized.
+    """
+    if not _NUCLIDE_RE.match(name):
+        return False
+
+    valid = _valid_nuclide_cache.get(name)
+    if valid is None:
+        try:
+            _nuclide_info(name)
+            valid = True
+        except Exception:
+            valid = False
+        _valid_nuclide_cache[name] = valid
+    return valid
+
+
+@functools.lru_cache(maxsize=4096)
+def _children(name: str) -> Tuple[Tuple[str, float, str, bool], ...]:
+    """Return cached (decay_mode, branching_fraction, child, child_is_nuclide) edges of a nuclide."""
+    info = _nuclide_info(name)
+    return tuple(
+        (mode, fraction, child, _is_valid_nuclide(child))
+        for mode, fraction, child in zip(info.decay_modes, info.branching_fractions, info.progeny)
+    )
+
 
 class SecularEquilibriumCalculator:
     """
@@ -23,6 +210,10 @@ class SecularEquilibriumCalculator:
 
     VALID_DECAY_TYPES = ['α', 'β-', 'β+', 'EC', 'SF', 'IT', 'p', 'n', 'd', 't']
     MAX_DEPTH = 30
+    # Paths with a smaller cumulative branching ratio are pruned. Totals below 1e-15 are
+    # reported as "not in decay chain", so anything this small is far below half an ulp
+    # of any reportable total and cannot change it.
+    MIN_PATH_RATIO = 1e-40
 
     @staticmethod
     def _normalize_decay_type(decay_type: Optional[str]) -> Optional[str]:
@@ -92,22 +283,30 @@ class SecularEquilibriumCalculator:
         self.measured_activity_uncertainty = measured_activity_uncertainty
         self.include_paths = include_paths
         self._branching_cache = {}
-        self._decay_fraction_cache = {}
 
         self._validate_nuclides()
 
     def _validate_nuclides(self):
         """Validate that nuclide names, decay type, and uncertainty are valid."""
-        try:
-            rd.Nuclide(self.measured_nuclide)
-        except Exception:
-            raise ValueError("Invalid measured nuclide name: {0}".format(self.measured_nuclide))
-
-        for parent in self.parent_nuclides:
+        # Resolve each distinct nuclide once; the records are reused by calculate().
+        self._nuclide_infos = {}
+        invalid = []
+        for name in dict.fromkeys([self.measured_nuclide] + list(self.parent_nuclides)):
             try:
-                rd.Nuclide(parent)
+                self._nuclide_infos[name] = _nuclide_info(name)
             except Exception:
-                raise ValueError("Invalid parent nuclide name: {0}".format(parent))
+                invalid.append(name)
+
+        if invalid:
+            errors = []
+            if self.measured_nuclide in invalid:
+                errors.append("Invalid measured nuclide name: {0}".format(self.measured_nuclide))
+            invalid_parents = [name for name in invalid if name != self.measured_nuclide]
+            if len(invalid_parents) == 1:
+                errors.append("Invalid parent nuclide name: {0}".format(invalid_parents[0]))
+            elif invalid_parents:
+                errors.append("Invalid parent nuclide names: {0}".format(', '.join(invalid_parents)))
+            raise ValueError('; '.join(errors))
 
         if self.decay_type is not None:
             if not isinstance(self.decay_type, str) or self.decay_type.strip() == '':
@@ -124,15 +323,6 @@ class SecularEquilibriumCalculator:
             if self.measured_activity_uncertainty < 0:
                 raise ValueError("measured_activity_uncertainty must be >= 0")
 
-    @staticmethod
-    def _is_nuclide_name(name: str) -> bool:
-        """Return True when the given decay child token is a nuclide name."""
-        try:
-            rd.Nuclide(name)
-            return True
-        except Exception:
-            return False
-
     def _get_decay_fraction_for_nuclide(self, nuclide: str) -> float:
         """
         Get the branching fraction of the measured nuclide for self.decay_type.
@@ -142,84 +332,103 @@ class SecularEquilibriumCalculator:
         if self.decay_type is None:
             return 1.0
 
-        cache_key = (nuclide, self.decay_type)
-        if cache_key in self._decay_fraction_cache:
-            return self._decay_fraction_cache[cache_key]
+        return _nuclide_info(nuclide).decay_type_fractions.get(self.decay_type, 0.0)
 
-        target_nuclide = rd.Nuclide(nuclide)
-        modes = target_nuclide.decay_modes()
-        fractions = target_nuclide.branching_fractions()
-
-        matching_fraction = 0.0
-        for mode, fraction in zip(modes, fractions):
-            if self.decay_type in mode:
-                matching_fraction += fraction
-
-        self._decay_fraction_cache[cache_key] = matching_fraction
-        return matching_fraction
-
-    def _enumerate_chain_paths(self, parent: str, progeny: str) -> List[Dict[str, object]]:
+    def _enumerate_chain_paths(self, parent: str, progeny: str) -> List[_ChainPath]:
         """
         Enumerate all acyclic decay paths from parent to progeny.
 
         Returns path entries with chain-level branching ratios (without measured-decay-type weighting).
+        Branches whose cumulative ratio drops below MIN_PATH_RATIO are pruned; the floor is
+        far below double precision of the smallest reportable total (1e-15), so pruning
+        never changes a reported branching ratio.
+
+        Results do not depend on decay_type and are cached at module level, shared by
+        all calculator instances; callers must treat the returned path entries as read-only.
         """
+        cache_key = (parent, progeny, self.MAX_DEPTH, self.MIN_PATH_RATIO)
+        if cache_key in _chain_paths_cache:
+            return _chain_paths_cache[cache_key]
+
         if parent == progeny:
-            return [{
-                'nodes': [parent],
-                'decay_modes': [],
-                'step_branching_fractions': [],
-                'chain_branching_ratio': 1.0,
-            }]
+            paths = [_ChainPath(
+                nodes=[parent],
+                decay_modes=[],
+                step_branching_fractions=[],
+                chain_branching_ratio=1.0,
+            )]
+            _chain_paths_cache[cache_key] = paths
+            return paths
+
+        # Index every nuclide reachable from the parent (BFS) so the DFS can track
+        # visited nodes as an int bitmask instead of a set of names.
+        name_to_idx = {parent: 0}
+        idx_to_name = [parent]
+        adjacency = []
+        for name in idx_to_name:
+            edges = []
+            for mode, fraction, child, valid in _children(name):
+                if not valid:
+                    continue
+                if child not in name_to_idx:
+                    name_to_idx[child] = len(idx_to_name)
+                    idx_to_name.append(child)
+                edges.append((mode, fraction, name_to_idx[child]))
+            adjacency.append(edges)
 
         paths = []
+        progeny_idx = name_to_idx.get(progeny)
+        if progeny_idx is None:
+            _chain_paths_cache[cache_key] = paths
+            return paths
+
+        nodes = [0]
+        modes = []
+        fractions = []
+        ratios = [1.0]
+        visited_mask = 1
+        stack = [iter(adjacency[0])]
+
+        # Iterative DFS: the path lists are mutated in place and only copied when
+        # a complete path to the progeny is found.
+        while stack:
+            for mode, fraction, child in stack[-1]:
+                child_bit = 1 << child
+                if fraction == 0.0 or visited_mask & child_bit:
+                    continue
 
-        def dfs(
-            current: str,
-            visited: set,
-            nodes: List[str],
-            modes: List[str],
-            step_fractions: List[float],
-            cumulative_ratio: float,
-            depth: int,
-        ):
-            if depth > self.MAX_DEPTH:
-                return
-
-            if current == progeny:
-                paths.append({
-                    'nodes': nodes,
-                    'decay_modes': modes,
-                    'step_branching_fractions': step_fractions,
-                    'chain_branching_ratio': cumulative_ratio,
-                })
-                return
-
-            try:
-                nuclide = rd.Nuclide(current)
-            except Exception:
-                return
-
-            child_modes = nuclide.decay_modes()
-            child_fractions = nuclide.branching_fractions()
-            child_nuclides = nuclide.progeny()
-
-            for mode, fraction, child in zip(child_modes, child_fractions, child_nuclides):
-                if not self._is_nuclide_name(child):
+                cumulative_ratio = ratios[-1] * fraction
+                if cumulative_ratio < self.MIN_PATH_RATIO:
+                    # Descendants can only shrink the ratio further.
                     continue
-                if child in visited:
+                if child == progeny_idx:
+                    paths.append(_ChainPath(
+                        nodes=[idx_to_name[idx] for idx in nodes] + [progeny],
+                        decay_modes=modes + [mode],
+                        step_branching_fractions=fractions + [fraction],
+                        chain_branching_ratio=cumulative_ratio,
+                    ))
+                    continue
+                if len(nodes) >= self.MAX_DEPTH:
+                    # Descendants of this child would exceed MAX_DEPTH.
                     continue
-                dfs(
-                    child,
-                    visited | {child},
-                    nodes + [child],
-                    modes + [mode],
-                    step_fractions + [fraction],
-                    cumulative_ratio * fraction,
-                    depth + 1,
-                )
 
-        dfs(parent, {parent}, [parent], [], [], 1.0, 0)
+                nodes.append(child)
+                modes.append(mode)
+                fractions.append(fraction)
+                ratios.append(cumulative_ratio)
+                visited_mask |= child_bit
+                stack.append(iter(adjacency[child]))
+                break
+            else:
+                stack.pop()
+                if stack:
+                    visited_mask &= ~(1 << nodes.pop())
+                    modes.pop()
+                    fractions.pop()
+                    ratios.pop()
+
+        _chain_paths_cache[cache_key] = paths
         return paths
 
     def _get_branching_info(self, parent: str, progeny: str) -> Dict[str, object]:
@@ -229,7 +438,7 @@ class SecularEquilibriumCalculator:
         Returns:
             {
                 'branching_ratio': float,
-                'paths': List[path_dict],
+                'paths': List[PathInfo] (None unless include_paths is set),
                 'decay_type_fraction_at_measured': float
             }
         """
@@ -237,44 +446,66 @@ class SecularEquilibriumCalculator:
         if cache_key in self._branching_cache:
             return self._branching_cache[cache_key]
 
+        # A nuclide measured against itself needs no chain walk or equilibrium check, and
+        # keeps a ratio of 1 even when decay_type is set (historical behavior).
+        if parent == progeny:
+            path_details = None
+            if self.include_paths:
+                path_details = [PathInfo(
+                    nodes=[parent],
+                    decay_modes=[],
+                    step_branching_fractions=[],
+                    chain_branching_ratio=1.0,
+                    decay_type_fraction_at_measured=1.0,
+                    path_branching_ratio=1.0,
+                )]
+            info = {
+                'branching_ratio': 1.0,
+                'paths': path_details,
+                'decay_type_fraction_at_measured': 1.0,
+            }
+            self._branching_cache[cache_key] = info
+            return info
+
         try:
-            progeny_nuclide = rd.Nuclide(progeny)
+            progeny_info = _nuclide_info(progeny)
         except Exception:
             raise ValueError("Invalid progeny nuclide name: {0}".format(progeny))
 
-        progeny_halflife = progeny_nuclide.half_life('s')
-        if progeny_halflife == float('inf'):
+        if progeny_info.halflife_s == float('inf'):
             raise ValueError("{0} is a stable nuclide and cannot establish secular equilibrium".format(progeny))
 
         chain_paths = self._enumerate_chain_paths(parent, progeny)
         if not chain_paths:
             raise ValueError("{0} is not in {1}'s decay chain".format(progeny, parent))
 
-        # Keep historical behavior: if parent == measured nuclide, ratio remains 1 even when decay_type is set.
-        if self.decay_type is not None and parent != progeny:
+        if self.decay_type is not None:
             decay_type_fraction = self._get_decay_fraction_for_nuclide(progeny)
         else:
             decay_type_fraction = 1.0
 
-        path_details = []
         total_branching_ratio = 0.0
         for path in chain_paths:
-            path_ratio = path['chain_branching_ratio'] * decay_type_fraction
-            details = {
-                'nodes': path['nodes'],
-                'decay_modes': path['decay_modes'],
-                'step_branching_fractions': path['step_branching_fractions'],
-                'chain_branching_ratio': path['chain_branching_ratio'],
-                'decay_type_fraction_at_measured': decay_type_fraction,
-                'path_branching_ratio': path_ratio,
-            }
-            total_branching_ratio += path_ratio
-            path_details.append(details)
+            total_branching_ratio += path.chain_branching_ratio * decay_type_fraction
 
         if total_branching_ratio < 1e-15:
             raise ValueError("{0} is not in {1}'s decay chain".format(progeny, parent))
 
-        path_details.sort(key=lambda item: item['path_branching_ratio'], reverse=True)
+        path_details = None
+        if self.include_paths:
+            path_details = [
+                # Fresh lists: chain paths are shared through the module-level cache.
+                PathInfo(
+                    nodes=list(path.nodes),
+                    decay_modes=list(path.decay_modes),
+                    step_branching_fractions=list(path.step_branching_fractions),
+                    chain_branching_ratio=path.chain_branching_ratio,
+                    decay_type_fraction_at_measured=decay_type_fraction,
+                    path_branching_ratio=path.chain_branching_ratio * decay_type_fraction,
+                )
+                for path in chain_paths
+            ]
+            path_details.sort(key=operator.attrgetter('path_branching_ratio'), reverse=True)
 
         info = {
             'branching_ratio': total_branching_ratio,
@@ -289,90 +520,100 @@ class SecularEquilibriumCalculator:
         info = self._get_branching_info(parent, progeny)
         return info['branching_ratio']
 
-    def calculate(self) -> Dict[str, Dict[str, float]]:
+    def calculate(self) -> Dict[str, ParentResult]:
         """
         Calculate activities and masses for parent nuclides.
 
         Returns:
-            Dictionary with format:
-            {
-                'parent_name': {
-                    'activity_Bq': float,
-                    'mass_g': float,
-                    'branching_ratio': float,
-                    'halflife_yr': float,
-                    'atomic_mass': float,
-                    ... optional uncertainty/path fields ...
-                }
-            }
+            Dictionary mapping each parent name to its ParentResult
+            (activity_Bq, mass_g, branching_ratio, halflife_yr, atomic_mass,
+            plus optional uncertainty/path/error fields).
         """
-        results = {}
-        avogadro_number = 6.02214076e23
+        return dict(self._iter_parent_results())
 
+    def _iter_parent_results(self) -> Iterator[Tuple[str, ParentResult]]:
+        """Yield (parent, ParentResult) pairs in parent order, building each result once."""
+        entries = []
+        resolved = []
         for parent in self.parent_nuclides:
             try:
                 branching_info = self._get_branching_info(parent, self.measured_nuclide)
-                branching_ratio = branching_info['branching_ratio']
             except ValueError as exc:
-                result = {
-                    'activity_Bq': 0.0,
-                    'mass_g': 0.0,
-                    'branching_ratio': 0.0,
-                    'halflife_yr': 0.0,
-                    'error': str(exc),
-                }
-                if self.include_paths:
-                    result['paths'] = []
-                    result['total_branching_ratio'] = 0.0
-                results[parent] = result
+                entries.append((parent, None, str(exc)))
                 continue
-
-            parent_activity = self.measured_activity / branching_ratio
-
-            parent_nuclide = rd.Nuclide(parent)
-            parent_halflife_s = parent_nuclide.half_life('s')
-            parent_halflife_yr = parent_halflife_s / (365.25 * 24 * 3600)
-            parent_mass_amu = parent_nuclide.atomic_mass
-
-            if parent_halflife_s == float('inf'):
-                parent_mass = float('inf')
-                mass_coefficient = None
-            else:
-                lambda_parent = math.log(2) / parent_halflife_s
-                mass_coefficient = parent_mass_amu / (avogadro_number * lambda_parent)
-                parent_mass = parent_activity * mass_coefficient
-
-            result = {
-                'activity_Bq': parent_activity,
-                'mass_g': parent_mass,
-                'branching_ratio': branching_ratio,
-                'halflife_yr': parent_halflife_yr,
-                'atomic_mass': parent_mass_amu,
-            }
-
+            entries.append((parent, branching_info, None))
+            resolved.append((parent, branching_info))
+
+        if resolved:
+            # Per-parent physics is evaluated for all resolved parents at once.
+            parent_infos = [self._nuclide_infos[parent] for parent, _ in resolved]
+            branching = np.array([info['branching_ratio'] for _, info in resolved], dtype=float)
+            halflives = np.array([info.halflife_s for info in parent_infos], dtype=float)
+            masses_amu = np.array([info.atomic_mass for info in parent_infos], dtype=float)
+            stable = np.isinf(halflives)
+
+            # One reciprocal shared by activity and uncertainty; results agree with
+            # direct division to within 1 ULP.
+            inv_branching = 1.0 / branching
+            activities = self.measured_activity * inv_branching
+            with np.errstate(divide='ignore', invalid='ignore'):
+                lambdas = _LN2 / halflives
+                mass_coeffs = masses_amu / (_AVOGADRO * lambdas)
+                parent_masses = np.where(stable, np.inf, activities * mass_coeffs)
+            halflives_yr = halflives / _SECONDS_PER_YEAR
+
+            activity_list = activities.tolist()
             if self.measured_activity_uncertainty is not None:
-                activity_uncertainty = self.measured_activity_uncertainty / branching_ratio
-                if parent_halflife_s == float('inf'):
-                    mass_uncertainty = float('inf')
-                else:
-                    mass_uncertainty = activity_uncertainty * mass_coefficient
-
-                if parent_activity == 0.0:
-                    relative_uncertainty = None
-                else:
-                    relative_uncertainty = activity_uncertainty / abs(parent_activity)
-
-                result['activity_uncertainty_Bq'] = activity_uncertainty
-                result['mass_uncertainty_g'] = mass_uncertainty
-                result['relative_uncertainty'] = relative_uncertainty
-
-            if self.include_paths:
-                result['paths'] = branching_info['paths']
-                result['total_branching_ratio'] = branching_ratio
+                activity_uncertainties = self.measured_activity_uncertainty * inv_branching
+                with np.errstate(invalid='ignore'):
+                    mass_uncertainties = np.where(stable, np.inf, activity_uncertainties * mass_coeffs)
+                activity_uncertainty_list = activity_uncertainties.tolist()
+                mass_uncertainty_list = mass_uncertainties.tolist()
+                relative_uncertainty_list = [
+                    None if activity == 0.0 else uncertainty / abs(activity)
+                    for activity, uncertainty in zip(activity_list, activity_uncertainty_list)
+                ]
+            else:
+                activity_uncertainty_list = mass_uncertainty_list = relative_uncertainty_list = [None] * len(resolved)
+
+            physics = zip(
+                activity_list,
+                parent_masses.tolist(),
+                branching.tolist(),
+                halflives_yr.tolist(),
+                masses_amu.tolist(),
+                activity_uncertainty_list,
+                mass_uncertainty_list,
+                relative_uncertainty_list,
+            )
 
-            results[parent] = result
+        for parent, branching_info, error in entries:
+            if error is not None:
+                yield parent, ParentResult(
+                    activity_Bq=0.0,
+                    mass_g=0.0,
+                    branching_ratio=0.0,
+                    halflife_yr=0.0,
+                    error=error,
+                    paths=[] if self.include_paths else None,
+                    total_branching_ratio=0.0 if self.include_paths else None,
+                )
+                continue
 
-        return results
+            (activity, mass, branching_ratio, halflife_yr, atomic_mass,
+             activity_uncertainty, mass_uncertainty, relative_uncertainty) = next(physics)
+            yield parent, ParentResult(
+                activity_Bq=activity,
+                mass_g=mass,
+                branching_ratio=branching_ratio,
+                halflife_yr=halflife_yr,
+                atomic_mass=atomic_mass,
+                activity_uncertainty_Bq=activity_uncertainty,
+                mass_uncertainty_g=mass_uncertainty,
+                relative_uncertainty=relative_uncertainty,
+                paths=branching_info['paths'],
+                total_branching_ratio=branching_ratio if self.include_paths else None,
+            )
 
     def print_results(self, results: Optional[Dict] = None):
         """
@@ -384,83 +625,87 @@ class SecularEquilibriumCalculator:
         if results is None:
             results = self.calculate()
 
-        print("=" * 80)
-        print("Secular Equilibrium Calculation Results")
-        print("=" * 80)
-        print("\nMeasured nuclide: {0}".format(self.measured_nuclide))
-        print("Measured activity: {0:.4e} Bq".format(self.measured_activity))
+        # Build the whole report first and emit it with a single write.
+        lines = []
+        lines.append("=" * 80)
+        lines.append("Secular Equilibrium Calculation Results")
+        lines.append("=" * 80)
+        lines.append("\nMeasured nuclide: {0}".format(self.measured_nuclide))
+        lines.append("Measured activity: {0:.4e} Bq".format(self.measured_activity))
         if self.measured_activity_uncertainty is not None:
-            print("Measured activity uncertainty: {0:.4e} Bq".format(self.measured_activity_uncertainty))
-        print("\n" + "-" * 80)
+            lines.append("Measured activity uncertainty: {0:.4e} Bq".format(self.measured_activity_uncertainty))
+        lines.append("\n" + "-" * 80)
 
         for parent, data in results.items():
-            print("\nParent nuclide: {0}".format(parent))
+            lines.append("\nParent nuclide: {0}".format(parent))
 
-            if 'error' in data:
-                print("  Error: {0}".format(data['error']))
-                print(
+            if data.error is not None:
+                lines.append("  Error: {0}".format(data.error))
+                lines.append(
                     "  Branching ratio ({0} -> {1}): {2:.6f}".format(
                         parent,
                         self.measured_nuclide,
-                        data['branching_ratio'],
+                        data.branching_ratio,
                     )
                 )
                 continue
 
-            print("  Half-life: {0:.4e} years".format(data['halflife_yr']))
-            print("  Atomic mass: {0:.4f} u".format(data['atomic_mass']))
-            print(
+            lines.append("  Half-life: {0:.4e} years".format(data.halflife_yr))
+            lines.append("  Atomic mass: {0:.4f} u".format(data.atomic_mass))
+            lines.append(
                 "  Branching ratio ({0} -> {1}): {2:.6f}".format(
                     parent,
                     self.measured_nuclide,
-                    data['branching_ratio'],
+                    data.branching_ratio,
                 )
             )
-            print("  Calculated activity: {0:.4e} Bq".format(data['activity_Bq']))
+            lines.append("  Calculated activity: {0:.4e} Bq".format(data.activity_Bq))
 
-            if data['mass_g'] == float('inf'):
-                print("  Mass: Cannot calculate (stable nuclide)")
+            if data.mass_g == float('inf'):
+                lines.append("  Mass: Cannot calculate (stable nuclide)")
             else:
-                print("  Mass: {0:.4e} g".format(data['mass_g']))
-                if data['mass_g'] < 1e-6:
-                    print("       {0:.4e} ng".format(data['mass_g'] * 1e9))
-                elif data['mass_g'] < 1e-3:
-                    print("       {0:.4e} ug".format(data['mass_g'] * 1e6))
-                elif data['mass_g'] < 1:
-                    print("       {0:.4e} mg".format(data['mass_g'] * 1e3))
-
-            if 'activity_uncertainty_Bq' in data:
-                print("  Activity uncertainty: {0:.4e} Bq".format(data['activity_uncertainty_Bq']))
-                if data['mass_uncertainty_g'] == float('inf'):
-                    print("  Mass uncertainty: inf")
+                lines.append("  Mass: {0:.4e} g".format(data.mass_g))
+                if data.mass_g < 1e-6:
+                    lines.append("       {0:.4e} ng".format(data.mass_g * 1e9))
+                elif data.mass_g < 1e-3:
+                    lines.append("       {0:.4e} ug".format(data.mass_g * 1e6))
+                elif data.mass_g < 1:
+                    lines.append("       {0:.4e} mg".format(data.mass_g * 1e3))
+
+            if data.activity_uncertainty_Bq is not None:
+                lines.append("  Activity uncertainty: {0:.4e} Bq".format(data.activity_uncertainty_Bq))
+                if data.mass_uncertainty_g == float('inf'):
+                    lines.append("  Mass uncertainty: inf")
                 else:
-                    print("  Mass uncertainty: {0:.4e} g".format(data['mass_uncertainty_g']))
-                if data['relative_uncertainty'] is None:
-                    print("  Relative uncertainty: N/A (zero activity)")
+                    lines.append("  Mass uncertainty: {0:.4e} g".format(data.mass_uncertainty_g))
+                if data.relative_uncertainty is None:
+                    lines.append("  Relative uncertainty: N/A (zero activity)")
                 else:
-                    print("  Relative uncertainty: {0:.2%}".format(data['relative_uncertainty']))
+                    lines.append("  Relative uncertainty: {0:.2%}".format(data.relative_uncertainty))
 
             if self.include_paths:
-                print("  Path contributions:")
-                paths = data.get('paths', [])
+                lines.append("  Path contributions:")
+                paths = data.paths or []
                 if not paths:
-                    print("    (none)")
+                    lines.append("    (none)")
                 for idx, path in enumerate(paths, start=1):
-                    path_nodes = " -> ".join(path['nodes'])
-                    path_modes = " | ".join(path['decay_modes']) if path['decay_modes'] else "(same nuclide)"
-                    print("    [{0}] {1}".format(idx, path_nodes))
-                    print("        Modes: {0}".format(path_modes))
-                    print("        Chain branching ratio: {0:.6e}".format(path['chain_branching_ratio']))
-                    if self.decay_type is not None and path['decay_type_fraction_at_measured'] != 1.0:
-                        print(
+                    path_nodes = " -> ".join(path.nodes)
+                    path_modes = " | ".join(path.decay_modes) if path.decay_modes else "(same nuclide)"
+                    lines.append("    [{0}] {1}".format(idx, path_nodes))
+                    lines.append("        Modes: {0}".format(path_modes))
+                    lines.append("        Chain branching ratio: {0:.6e}".format(path.chain_branching_ratio))
+                    if self.decay_type is not None and path.decay_type_fraction_at_measured != 1.0:
+                        lines.append(
                             "        Measured decay-type fraction ({0}): {1:.6e}".format(
                                 self.decay_type,
-                                path['decay_type_fraction_at_measured'],
+                                path.decay_type_fraction_at_measured,
                             )
                         )
-                    print("        Path contribution: {0:.6e}".format(path['path_branching_ratio']))
+                    lines.append("        Path contribution: {0:.6e}".format(path.path_branching_ratio))
+
+        lines.append("\n" + "=" * 80)
 
-        print("\n" + "=" * 80)
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def calculate_secular_equilibrium(
@@ -471,7 +716,7 @@ def calculate_secular_equilibrium(
     verbose: bool = True,
     measured_activity_uncertainty: Optional[float] = None,
     include_paths: bool = False,
-) -> Dict[str, Dict[str, float]]:
+) -> Dict[str, ParentResult]:
     """
     Convenience function: calculate secular equilibrium for radioactive decay chains.
 
@@ -3,29 +3,89 @@ Command-line interface for secular equilibrium calculator.
 """
 
 import argparse
+import contextlib
 import csv
+import functools
+import io
+import itertools
 import json
+import math
+import operator
+import os
 import sys
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 from . import __version__
 from .calculator import calculate_secular_equilibrium
 
 
-def _parse_parent_nuclides(raw_value: str) -> List[str]:
-    """Parse parent nuclide list from semicolon/comma/space-separated text."""
-    text = (raw_value or '').strip()
-    if not text:
-        return []
+_POS_INF = float('inf')
+
+# Numeric result columns of a batch row, serialized per --precision (default '.12e').
+_FLOAT_FIELDS = (
+    'activity_Bq',
+    'mass_g',
+    'branching_ratio',
+    'halflife_yr',
+    'atomic_mass',
+    'activity_uncertainty_Bq',
+    'mass_uncertainty_g',
+    'relative_uncertainty',
+)
+
+# Batch input columns, in the order _parse_batch_row unpacks them; the first three are required.
+_BATCH_INPUT_COLUMNS = (
+    'measured_nuclide',
+    'measured_activity',
+    'parent_nuclides',
+    'decay_type',
+    'measured_activity_uncertainty',
+)
+
+# Batch output columns; rows are written positionally in this order.
+_BATCH_FIELDNAMES = (
+    'input_row',
+    'measured_nuclide',
+    'measured_activity',
+    'parent_nuclides',
+    'decay_type',
+    'measured_activity_uncertainty',
+    'parent',
+) + _FLOAT_FIELDS + (
+    'paths_json',
+    'error',
+)
+
+# Batch float formatters selected by --precision. 'repr' is the shortest round-trip form.
+_FLOAT_FORMATTERS = {
+    'full': '{0:.12e}'.format,
+    'short': '{0:.6e}'.format,
+    'repr': float.__repr__,
+}
+
+# Buffer size for batch CSV output; rows are small, frequent writes.
+_OUTPUT_BUFFER_SIZE = 1024 * 1024
+
+# json.dumps(..., ensure_ascii=False) builds a new encoder per call; reuse one instead.
+_PATHS_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+# Input rows read ahead per chunk; bounds memory while giving the process pool work to share.
+_BATCH_CHUNK_ROWS = 256
+
+# Solved configurations kept across chunks (cleared when exceeded), matching _solve_unit's cache.
+_SOLVED_CONFIGS_MAX = 1024
+
+_PARENT_DELIMS = str.maketrans({';': ' ', ',': ' '})
+
+# Values for the parent..paths_json columns of a row that failed before any parent was solved.
+_EMPTY_RESULT_VALUES = ('',) * (len(_FLOAT_FIELDS) + 2)
 
-    if ';' in text:
-        parts = text.split(';')
-    elif ',' in text:
-        parts = text.split(',')
-    else:
-        parts = text.split()
 
-    return [item.strip() for item in parts if item.strip()]
+def _parse_parent_nuclides(raw_value: str) -> List[str]:
+    """Parse parent nuclide list from semicolon/comma/space-separated text."""
+    # Normalize both delimiters to whitespace; split() drops empty items.
+    return (raw_value or '').translate(_PARENT_DELIMS).split()
 
 
 def _parse_optional_float(raw_value: Optional[str]) -> Optional[float]:
@@ -39,157 +99,346 @@ def _parse_optional_float(raw_value: Optional[str]) -> Optional[float]:
 
 
 def _format_mass(value: float) -> str:
-    if value == float('inf'):
-        return 'inf'
-    return '{0:.4e}'.format(value)
+    return 'inf' if value == _POS_INF else format(value, '.4e')
 
 
 def _format_activity(value: float) -> str:
-    if value == float('inf'):
-        return 'inf'
-    return '{0:.4e}'.format(value)
-
-
-def _csv_value(value):
-    """Serialize output value for CSV."""
-    if value is None:
-        return ''
-    if isinstance(value, float):
-        if value == float('inf'):
-            return 'inf'
-        if value == float('-inf'):
-            return '-inf'
-        return '{0:.12e}'.format(value)
-    return value
-
-
-def _build_batch_output_rows(args) -> Tuple[List[Dict[str, str]], bool]:
-    """Process input CSV and return output rows plus error status."""
-    required_columns = ['measured_nuclide', 'measured_activity', 'parent_nuclides']
-    rows = []
-    had_errors = False
-
-    with open(args.input_csv, 'r', encoding='utf-8', newline='') as input_file:
-        reader = csv.DictReader(input_file)
-        if reader.fieldnames is None:
-            raise ValueError('Input CSV is missing header row')
-
-        missing = [col for col in required_columns if col not in reader.fieldnames]
-        if missing:
-            raise ValueError('Missing required CSV columns: {0}'.format(', '.join(missing)))
-
-        for index, input_row in enumerate(reader, start=2):
-            measured_nuclide = (input_row.get('measured_nuclide') or '').strip()
-            measured_activity_text = (input_row.get('measured_activity') or '').strip()
-            parent_nuclides_text = (input_row.get('parent_nuclides') or '').strip()
-            decay_type_text = (input_row.get('decay_type') or '').strip() or None
-            unc_text = (input_row.get('measured_activity_uncertainty') or '').strip()
-
-            row_base = {
-                'input_row': index,
-                'measured_nuclide': measured_nuclide,
-                'measured_activity': measured_activity_text,
-                'parent_nuclides': parent_nuclides_text,
-                'decay_type': decay_type_text or '',
-                'measured_activity_uncertainty': unc_text,
-            }
-
-            try:
-                measured_activity = float(measured_activity_text)
-                parent_nuclides = _parse_parent_nuclides(parent_nuclides_text)
-                measured_activity_uncertainty = _parse_optional_float(unc_text)
-
-                if not measured_nuclide:
-                    raise ValueError('row {0}: measured_nuclide is empty'.format(index))
-                if not parent_nuclides:
-                    raise ValueError('row {0}: parent_nuclides is empty'.format(index))
-
-                results = calculate_secular_equilibrium(
-                    measured_nuclide=measured_nuclide,
-                    measured_activity=measured_activity,
-                    parent_nuclides=parent_nuclides,
-                    decay_type=decay_type_text,
-                    measured_activity_uncertainty=measured_activity_uncertainty,
-                    include_paths=args.explain_paths,
-                    verbose=False,
-                )
-
-                for parent in parent_nuclides:
-                    data = results.get(parent, {})
-                    error = data.get('error', '')
-                    if error:
-                        had_errors = True
-
-                    paths_json = ''
-                    if args.explain_paths and 'paths' in data:
-                        paths_json = json.dumps(data['paths'], ensure_ascii=False)
-
-                    rows.append({
-                        **row_base,
-                        'parent': parent,
-                        'activity_Bq': _csv_value(data.get('activity_Bq')),
-                        'mass_g': _csv_value(data.get('mass_g')),
-                        'branching_ratio': _csv_value(data.get('branching_ratio')),
-                        'halflife_yr': _csv_value(data.get('halflife_yr')),
-                        'atomic_mass': _csv_value(data.get('atomic_mass')),
-                        'activity_uncertainty_Bq': _csv_value(data.get('activity_uncertainty_Bq')),
-                        'mass_uncertainty_g': _csv_value(data.get('mass_uncertainty_g')),
-                        'relative_uncertainty': _csv_value(data.get('relative_uncertainty')),
-                        'paths_json': paths_json,
-                        'error': error,
-                    })
-
-            except Exception as exc:
-                had_errors = True
-                rows.append({
-                    **row_base,
-                    'parent': '',
-                    'activity_Bq': '',
-                    'mass_g': '',
-                    'branching_ratio': '',
-                    'halflife_yr': '',
-                    'atomic_mass': '',
-                    'activity_uncertainty_Bq': '',
-                    'mass_uncertainty_g': '',
-                    'relative_uncertainty': '',
-                    'paths_json': '',
-                    'error': str(exc),
-                })
-
-    return rows, had_errors
-
-
-def _write_batch_output(rows: List[Dict[str, str]], output_csv: Optional[str]):
-    """Write batch rows to stdout or output file."""
-    fieldnames = [
-        'input_row',
-        'measured_nuclide',
-        'measured_activity',
-        'parent_nuclides',
-        'decay_type',
-        'measured_activity_uncertainty',
-        'parent',
-        'activity_Bq',
-        'mass_g',
-        'branching_ratio',
-        'halflife_yr',
-        'atomic_mass',
-        'activity_uncertainty_Bq',
-        'mass_uncertainty_g',
-        'relative_uncertainty',
-        'paths_json',
-        'error',
+    return 'inf' if value == _POS_INF else format(value, '.4e')
+
+
+# Arguments of _solve_unit: measured nuclide, parents, decay type, include_paths, precision.
+_BatchConfig = Tuple[str, Tuple[str, ...], Optional[str], bool, str]
+
+
+def _format_float_field(value: Optional[float], format_float: Callable[[float], str]) -> str:
+    """Format a batch float column, writing None as a blank field."""
+    return '' if value is None else format_float(value)
+
+
+class _UnitResult(NamedTuple):
+    """Per-parent batch result at a measured activity of 1 Bq, with row-invariant columns pre-rendered."""
+
+    activity_Bq: float
+    mass_g: float
+    invariant_columns: Tuple[str, str, str]  # branching_ratio, halflife_yr, atomic_mass
+    paths_json: str
+    error: str
+
+
+@functools.lru_cache(maxsize=1024)
+def _solve_unit(
+    measured_nuclide: str,
+    parent_nuclides: Tuple[str, ...],
+    decay_type: Optional[str],
+    include_paths: bool,
+    precision: str,
+) -> Dict[str, _UnitResult]:
+    """Solve one nuclide configuration for a measured activity of 1 Bq (memoized)."""
+    format_float = _FLOAT_FORMATTERS[precision]
+    results = calculate_secular_equilibrium(
+        measured_nuclide=measured_nuclide,
+        measured_activity=1.0,
+        parent_nuclides=list(parent_nuclides),
+        decay_type=decay_type,
+        include_paths=include_paths,
+        verbose=False,
+    )
+
+    unit_results = {}
+    for parent, data in results.items():
+        paths_json = ''
+        if include_paths and data.paths is not None:
+            paths_json = _PATHS_JSON_ENCODER.encode([path._asdict() for path in data.paths])
+        unit_results[parent] = _UnitResult(
+            activity_Bq=data.activity_Bq,
+            mass_g=data.mass_g,
+            invariant_columns=(
+                _format_float_field(data.branching_ratio, format_float),
+                _format_float_field(data.halflife_yr, format_float),
+                '' if data.error else _format_float_field(data.atomic_mass, format_float),
+            ),
+            paths_json=paths_json,
+            error=data.error or '',
+        )
+    return unit_results
+
+
+def _scale_unit_result(
+    unit: _UnitResult,
+    measured_activity: float,
+    measured_activity_uncertainty: Optional[float],
+) -> Tuple[Optional[float], ...]:
+    """
+    Return activity, mass and their uncertainties of a unit result scaled to a measured activity.
+
+    The values are activity_Bq, mass_g, activity_uncertainty_Bq, mass_uncertainty_g
+    and relative_uncertainty; all but the last are linear in the measured activity.
+    """
+    if unit.error:
+        return (unit.activity_Bq, unit.mass_g, None, None, None)
+
+    unit_mass = unit.mass_g
+    mass_is_inf = math.isinf(unit_mass)
+    activity = unit.activity_Bq * measured_activity
+    mass = unit_mass if mass_is_inf else unit_mass * measured_activity
+    if measured_activity_uncertainty is None:
+        return (activity, mass, None, None, None)
+
+    activity_uncertainty = unit.activity_Bq * measured_activity_uncertainty
+    mass_uncertainty = unit_mass if mass_is_inf else unit_mass * measured_activity_uncertainty
+    relative_uncertainty = None if activity == 0.0 else activity_uncertainty / abs(activity)
+    return (activity, mass, activity_uncertainty, mass_uncertainty, relative_uncertainty)
+
+
+@contextlib.contextmanager
+def _open_input(path: str):
+    """Open the batch input CSV, reading stdin when path is '-'; stdin is left open."""
+    if path != '-':
+        with open(path, 'r', encoding='utf-8', newline='') as input_file:
+            yield input_file
+        return
+
+    if sys.stdin is None:
+        raise ValueError('stdin is not available for --input-csv -')
+    # stdin may be replaced by a stream without reconfigure (e.g. io.StringIO)
+    reconfigure = getattr(sys.stdin, 'reconfigure', None)
+    if reconfigure is not None:
+        # The csv module needs untranslated newlines; only possible before stdin is read.
+        reconfigure(encoding='utf-8', newline='')
+    yield sys.stdin
+
+
+def _read_batch_header(input_file) -> Tuple[Iterator[List[str]], Callable[[List[str]], Tuple[str, ...]]]:
+    """
+    Validate the header row of the input CSV.
+
+    Returns the non-blank data rows, padded to the header width, and a getter
+    selecting the _BATCH_INPUT_COLUMNS fields of a row.
+    """
+    reader = csv.reader(input_file)
+    header = next(reader, None)
+    if header is None:
+        raise ValueError('Input CSV is missing header row')
+
+    missing = [col for col in _BATCH_INPUT_COLUMNS[:3] if col not in header]
+    if missing:
+        raise ValueError('Missing required CSV columns: {0}'.format(', '.join(missing)))
+
+    # Later duplicates win, as with csv.DictReader; absent optional columns read a blank
+    # padding cell appended after the header width.
+    header_width = len(header)
+    positions = {name: position for position, name in enumerate(header)}
+    selected = [positions.get(name, header_width) for name in _BATCH_INPUT_COLUMNS]
+    pad = header_width in selected
+
+    def iter_rows() -> Iterator[List[str]]:
+        for fields in reader:
+            if not fields:
+                continue
+            if len(fields) != header_width:
+                # As with csv.DictReader, missing fields are blank and extra fields are ignored.
+                fields = fields[:header_width] + [''] * (header_width - len(fields))
+            if pad:
+                fields.append('')
+            yield fields
+
+    return iter_rows(), operator.itemgetter(*selected)
+
+
+class _BatchRequest(NamedTuple):
+    """Validated inputs of one batch row."""
+
+    config: _BatchConfig
+    measured_activity: float
+    measured_activity_uncertainty: Optional[float]
+
+
+def _parse_batch_row(
+    index: int,
+    input_fields: Tuple[str, ...],
+    include_paths: bool,
+    precision: str,
+) -> Tuple[List[object], Union[_BatchRequest, ValueError]]:
+    """Return the echoed input columns of a row and its request, or the validation error."""
+    measured_nuclide, measured_activity_text, parent_nuclides_text, decay_type_text, unc_text = input_fields
+    measured_nuclide = measured_nuclide.strip()
+    measured_activity_text = measured_activity_text.strip()
+    parent_nuclides_text = parent_nuclides_text.strip()
+    decay_type_text = decay_type_text.strip() or None
+    unc_text = unc_text.strip()
+
+    row_base = [
+        index,
+        measured_nuclide,
+        measured_activity_text,
+        parent_nuclides_text,
+        decay_type_text or '',
+        unc_text,
     ]
 
+    # Invalid rows are common in batch input; they are reported by returning the error
+    # rather than raising it, and only float() parsing is guarded by try/except.
+    try:
+        measured_activity = float(measured_activity_text)
+        measured_activity_uncertainty = _parse_optional_float(unc_text)
+    except ValueError as exc:
+        return row_base, exc
+
+    parent_nuclides = _parse_parent_nuclides(parent_nuclides_text)
+    if not measured_nuclide:
+        return row_base, ValueError('row {0}: measured_nuclide is empty'.format(index))
+    if not parent_nuclides:
+        return row_base, ValueError('row {0}: parent_nuclides is empty'.format(index))
+
+    # Rows repeat a small set of nuclide names; interned names make the cache-key and
+    # per-parent result lookups compare by identity.
+    if decay_type_text is not None:
+        decay_type_text = sys.intern(decay_type_text)
+    request = _BatchRequest(
+        config=(
+            sys.intern(measured_nuclide),
+            tuple(map(sys.intern, parent_nuclides)),
+            decay_type_text,
+            include_paths,
+            precision,
+        ),
+        measured_activity=measured_activity,
+        measured_activity_uncertainty=measured_activity_uncertainty,
+    )
+    return row_base, request
+
+
+def _solve_unit_or_error(config: _BatchConfig):
+    """Solve a configuration with _solve_unit, returning its input ValueError instead of raising it."""
+    try:
+        return _solve_unit(*config)
+    except ValueError as exc:
+        return exc
+
+
+def _iter_batch_output_rows(
+    input_rows: Iterable[List[str]],
+    select_fields: Callable[[List[str]], Tuple[str, ...]],
+    args,
+) -> Iterator[Tuple[List[object], bool]]:
+    """
+    Process input rows lazily, yielding each output row (in _BATCH_FIELDNAMES order) with its error flag.
+
+    Rows are read in chunks of _BATCH_CHUNK_ROWS. Solved configurations are kept across
+    chunks; with args.jobs > 1 the configurations of a chunk that are not solved yet are
+    solved in a process pool before its rows are rendered.
+    """
+    parsed_rows = (
+        _parse_batch_row(index, select_fields(input_row), args.explain_paths, args.precision)
+        for index, input_row in enumerate(input_rows, start=2)
+    )
+    format_float = _FLOAT_FORMATTERS[args.precision]
+    jobs = args.jobs or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+
+    solved: Dict[_BatchConfig, Union[Dict[str, _UnitResult], ValueError]] = {}
+    try:
+        while True:
+            chunk = list(itertools.islice(parsed_rows, _BATCH_CHUNK_ROWS))
+            if not chunk:
+                break
+
+            if len(solved) > _SOLVED_CONFIGS_MAX:
+                solved.clear()
+
+            if executor is not None:
+                pending = [
+                    config for config in dict.fromkeys(
+                        request.config for _, request in chunk if isinstance(request, _BatchRequest)
+                    )
+                    if config not in solved
+                ]
+                # A single configuration is not worth the round trip to a worker.
+                if len(pending) > 1:
+                    chunksize = max(1, len(pending) // (jobs * 4))
+                    solved.update(zip(
+                        pending, executor.map(_solve_unit_or_error, pending, chunksize=chunksize)
+                    ))
+
+            for row_base, request in chunk:
+                if isinstance(request, _BatchRequest):
+                    # Rows often repeat a nuclide configuration with different activities, so the
+                    # decay-chain solve is cached at unit activity and scaled per row.
+                    unit_results = solved.get(request.config)
+                    if unit_results is None:
+                        unit_results = solved[request.config] = _solve_unit_or_error(request.config)
+                    # The unit solve never sees the row's uncertainty; checking it after the solve
+                    # keeps the calculator's order (nuclide and decay type errors come first).
+                    if (
+                        not isinstance(unit_results, ValueError)
+                        and request.measured_activity_uncertainty is not None
+                        and request.measured_activity_uncertainty < 0
+                    ):
+                        unit_results = ValueError('measured_activity_uncertainty must be >= 0')
+                else:
+                    unit_results = request
+
+                if isinstance(unit_results, ValueError):
+                    row = row_base.copy()
+                    row.extend(_EMPTY_RESULT_VALUES)
+                    row.append(str(unit_results))
+                    yield row, True
+                    continue
+
+                measured_activity = request.measured_activity
+                measured_activity_uncertainty = request.measured_activity_uncertainty
+                for parent in request.config[1]:
+                    unit = unit_results[parent]
+                    activity, mass, activity_unc, mass_unc, relative_unc = _scale_unit_result(
+                        unit, measured_activity, measured_activity_uncertainty
+                    )
+
+                    # Only the scaled columns are formatted per row; every formatter renders
+                    # infinities as 'inf'/'-inf'.
+                    row = row_base + [
+                        parent,
+                        format_float(activity),
+                        format_float(mass),
+                    ]
+                    row += unit.invariant_columns
+                    row += (
+                        _format_float_field(activity_unc, format_float),
+                        _format_float_field(mass_unc, format_float),
+                        _format_float_field(relative_unc, format_float),
+                        unit.paths_json,
+                        unit.error,
+                    )
+                    yield row, bool(unit.error)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def _write_batch_output(rows: Iterable[Tuple[List[object], bool]], output_csv: Optional[str]) -> bool:
+    """Stream batch rows to stdout or output file and return True if any row had an error."""
+    def write_rows(out_file) -> bool:
+        had_errors = False
+        writer = csv.writer(out_file)
+        writer.writerow(_BATCH_FIELDNAMES)
+        for row, row_had_error in rows:
+            writer.writerow(row)
+            had_errors |= row_had_error
+        return had_errors
+
     if output_csv:
-        with open(output_csv, 'w', encoding='utf-8', newline='') as out_file:
-            writer = csv.DictWriter(out_file, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
-    else:
-        writer = csv.DictWriter(sys.stdout, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+        with open(output_csv, 'w', encoding='utf-8', newline='', buffering=_OUTPUT_BUFFER_SIZE) as out_file:
+            return write_rows(out_file)
+
+    try:
+        stdout_fd = sys.stdout.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        # stdout replaced by an in-memory stream (e.g. redirect_stdout)
+        return write_rows(sys.stdout)
+
+    # Write through a large-buffered stream on the stdout descriptor, leaving it open afterwards.
+    sys.stdout.flush()
+    with open(stdout_fd, 'w', encoding='utf-8', newline='', buffering=_OUTPUT_BUFFER_SIZE, closefd=False) as out_file:
+        return write_rows(out_file)
 
 
 def _run_single_mode(args) -> int:
@@ -207,34 +456,28 @@ def _run_single_mode(args) -> int:
     )
 
     if args.mass_only:
-        output_parts = []
-        for parent in args.parents:
-            data = results.get(parent)
-            if data and 'error' not in data:
-                output_parts.append(_format_mass(data['mass_g']))
-            else:
-                output_parts.append('NaN')
+        output_parts = [
+            _format_mass(data.mass_g) if data is not None and data.error is None else 'NaN'
+            for data in map(results.get, args.parents)
+        ]
         print(' '.join(output_parts))
         return 0
 
     if args.quiet:
+        # Fields go straight into the space-joined list; no per-parent string is built.
+        with_uncertainty = args.activity_unc is not None
         output_parts = []
         for parent in args.parents:
             data = results.get(parent)
-            if data and 'error' not in data:
-                activity = _format_activity(data['activity_Bq'])
-                mass = _format_mass(data['mass_g'])
-                if args.activity_unc is not None and 'activity_uncertainty_Bq' in data:
-                    a_unc = _format_activity(data['activity_uncertainty_Bq'])
-                    m_unc = _format_mass(data['mass_uncertainty_g'])
-                    output_parts.append('{0} {1} {2} {3}'.format(activity, mass, a_unc, m_unc))
-                else:
-                    output_parts.append('{0} {1}'.format(activity, mass))
-            else:
-                if args.activity_unc is not None:
-                    output_parts.append('NaN NaN NaN NaN')
-                else:
-                    output_parts.append('NaN NaN')
+            if data is None or data.error is not None:
+                output_parts.extend(('NaN',) * (4 if with_uncertainty else 2))
+                continue
+
+            output_parts.append(_format_activity(data.activity_Bq))
+            output_parts.append(_format_mass(data.mass_g))
+            if with_uncertainty and data.activity_uncertainty_Bq is not None:
+                output_parts.append(_format_activity(data.activity_uncertainty_Bq))
+                output_parts.append(_format_mass(data.mass_uncertainty_g))
         print(' '.join(output_parts))
 
     return 0
@@ -248,13 +491,20 @@ def _run_batch_mode(args) -> int:
     if args.measured or args.activity is not None or args.parents:
         raise ValueError('--input-csv cannot be combined with --measured/--activity/--parents')
 
-    rows, had_errors = _build_batch_output_rows(args)
-    _write_batch_output(rows, args.output_csv)
+    if args.jobs < 0:
+        raise ValueError('--jobs must be >= 0')
+
+    with _open_input(args.input_csv) as input_file:
+        input_rows, select_fields = _read_batch_header(input_file)
+        had_errors = _write_batch_output(
+            _iter_batch_output_rows(input_rows, select_fields, args), args.output_csv
+        )
     return 1 if had_errors else 0
 
 
-def main():
-    """Command line main function."""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser once and reuse it across main() calls."""
     parser = argparse.ArgumentParser(
         description='Secular Equilibrium Calculator',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -272,8 +522,14 @@ Examples:
   # Batch mode from CSV
   secular-eq --input-csv batch_inputs.csv
 
+  # Batch mode reading CSV from a pipe
+  cat batch_inputs.csv | secular-eq --input-csv -
+
   # Batch mode to output file
   secular-eq --input-csv batch_inputs.csv --output-csv batch_outputs.csv
+
+  # Batch mode with 4 worker processes
+  secular-eq --input-csv batch_inputs.csv --jobs 4
         """,
     )
 
@@ -315,11 +571,27 @@ Examples:
 
     parser.add_argument(
         '--input-csv',
-        help='Batch mode input CSV path. Required columns: measured_nuclide, measured_activity, parent_nuclides. '
+        help='Batch mode input CSV path, or - to read stdin. Required columns: measured_nuclide, measured_activity, parent_nuclides. '
              'Optional columns: decay_type, measured_activity_uncertainty. '
              'Use semicolon-separated parent_nuclides (e.g., U-238;Ra-226).'
     )
 
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help='Batch mode: number of worker processes for decay-chain solves '
+             '(default: 1; 0 uses all CPUs)'
+    )
+
+    parser.add_argument(
+        '--precision',
+        choices=tuple(_FLOAT_FORMATTERS),
+        default='full',
+        help="Batch mode: float format of numeric columns. 'full' writes 13 significant digits, "
+             "'short' writes 7, 'repr' writes the shortest round-trip form (default: full)"
+    )
+
     parser.add_argument(
         '--output-csv',
         help='Batch mode output CSV path. Defaults to stdout when omitted.'
@@ -343,7 +615,12 @@ Examples:
         version='%(prog)s {0}'.format(__version__)
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Command line main function."""
+    args = _build_parser().parse_args()
 
     try:
         if args.input_csv:
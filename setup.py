@@ -17,6 +17,7 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=[
+        "numpy",
         "radioactivedecay>=0.6.0",
     ],
     entry_points={
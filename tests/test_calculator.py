@@ -1,6 +1,6 @@
 import unittest
 
-from secular_equilibrium import calculate_secular_equilibrium
+from secular_equilibrium import ParentResult, SecularEquilibriumCalculator, calculate_secular_equilibrium
 
 
 class TestSecularEquilibrium(unittest.TestCase):
@@ -31,6 +31,20 @@ class TestSecularEquilibrium(unittest.TestCase):
                 verbose=False,
             )
 
+    def test_invalid_parent_nuclides_reported_together(self):
+        """Test that all invalid parent names are reported in one error."""
+        with self.assertRaises(ValueError) as ctx:
+            calculate_secular_equilibrium(
+                measured_nuclide='Pb-214',
+                measured_activity=100.0,
+                parent_nuclides=['Invalid-998', 'U-238', 'Invalid-999', 'Invalid-998'],
+                verbose=False,
+            )
+
+        self.assertEqual(
+            str(ctx.exception), 'Invalid parent nuclide names: Invalid-998, Invalid-999'
+        )
+
     def test_decay_type_parameter(self):
         """Test decay_type parameter functionality."""
         results = calculate_secular_equilibrium(
@@ -156,6 +170,67 @@ class TestSecularEquilibrium(unittest.TestCase):
         total_from_paths = sum(path['path_branching_ratio'] for path in paths)
         self.assertAlmostEqual(total_from_paths, data['branching_ratio'], places=12)
 
+        path = paths[0]
+        self.assertIn('nodes', path)
+        self.assertNotIn('unknown_field', path)
+        self.assertEqual(path.get('nodes'), path.nodes)
+        self.assertIsNone(path.get('unknown_field'))
+        self.assertEqual(list(path.keys()), list(path._asdict().keys()))
+
+    def test_path_pruning_preserves_small_branching_ratios(self):
+        """Test pruned path enumeration matches the unpruned total for a small-ratio chain."""
+        for decay_type in (None, 'β-'):
+            pruned = SecularEquilibriumCalculator('Hg-206', 100.0, ['U-238'], decay_type=decay_type)
+            unpruned = SecularEquilibriumCalculator('Hg-206', 100.0, ['U-238'], decay_type=decay_type)
+            unpruned.MIN_PATH_RATIO = 0.0
+
+            pruned_ratio = pruned.calculate()['U-238']['branching_ratio']
+            self.assertEqual(pruned_ratio, unpruned.calculate()['U-238']['branching_ratio'])
+            self.assertAlmostEqual(pruned_ratio / 1.9e-08, 1.0, places=12)
+
+    def test_returned_paths_do_not_share_cached_lists(self):
+        """Test mutating returned paths does not leak into later calculations."""
+        def ac227_paths():
+            return calculate_secular_equilibrium(
+                measured_nuclide='Ra-223',
+                measured_activity=100.0,
+                parent_nuclides=['Ac-227'],
+                include_paths=True,
+                verbose=False,
+            )['Ac-227']['paths']
+
+        first = ac227_paths()
+        expected_nodes = list(first[0]['nodes'])
+        first[0]['nodes'].append('Xx-1')
+
+        self.assertEqual(ac227_paths()[0]['nodes'], expected_nodes)
+
+    def test_self_reference_of_stable_nuclide(self):
+        """Test a nuclide measured against itself succeeds, even when it is stable."""
+        results = calculate_secular_equilibrium(
+            measured_nuclide='Pb-206',
+            measured_activity=5.0,
+            parent_nuclides=['Pb-206'],
+            include_paths=True,
+            verbose=False,
+        )
+
+        data = results['Pb-206']
+        self.assertIsNone(data.error)
+        self.assertEqual(data.activity_Bq, 5.0)
+        self.assertEqual(data.branching_ratio, 1.0)
+        self.assertEqual(data.mass_g, float('inf'))
+        self.assertEqual(data.halflife_yr, float('inf'))
+        self.assertEqual(data.total_branching_ratio, 1.0)
+        self.assertEqual(len(data.paths), 1)
+        path = data.paths[0]
+        self.assertEqual(path.nodes, ['Pb-206'])
+        self.assertEqual(path.decay_modes, [])
+        self.assertEqual(path.step_branching_fractions, [])
+        self.assertEqual(path.chain_branching_ratio, 1.0)
+        self.assertEqual(path.decay_type_fraction_at_measured, 1.0)
+        self.assertEqual(path.path_branching_ratio, 1.0)
+
     def test_paths_not_returned_by_default(self):
         """Test that path details are omitted unless explicitly requested."""
         results = calculate_secular_equilibrium(
@@ -166,6 +241,26 @@ class TestSecularEquilibrium(unittest.TestCase):
         )
         self.assertNotIn('paths', results['U-238'])
 
+    def test_parent_result_attribute_and_mapping_access(self):
+        """Test ParentResult exposes fields as attributes and via the legacy dict protocol."""
+        results = calculate_secular_equilibrium(
+            measured_nuclide='Pb-214',
+            measured_activity=100.0,
+            parent_nuclides=['U-238', 'Pb-206'],
+            verbose=False,
+        )
+
+        data = results['U-238']
+        self.assertIsInstance(data, ParentResult)
+        self.assertEqual(data.mass_g, data['mass_g'])
+        self.assertNotIn('error', data)
+        self.assertIsNone(data.get('activity_uncertainty_Bq'))
+        with self.assertRaises(KeyError):
+            data['unknown_field']
+
+        self.assertIn('error', results['Pb-206'])
+        self.assertEqual(results['Pb-206'].get('mass_g'), 0.0)
+
 
 if __name__ == '__main__':
     unittest.main()
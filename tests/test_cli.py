@@ -1,17 +1,26 @@
+import contextlib
 import csv
 import io
 import os
-import subprocess
 import sys
 import tempfile
 import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from secular_equilibrium import cli
 
 
 class TestSecularEquilibriumCLI(unittest.TestCase):
 
     def _run_cli(self, args):
-        cmd = [sys.executable, '-m', 'secular_equilibrium.cli'] + args
-        return subprocess.run(cmd, capture_output=True, text=True)
+        out = io.StringIO()
+        err = io.StringIO()
+        with patch.object(sys, 'argv', ['secular-eq'] + args), \
+                contextlib.redirect_stdout(out), \
+                contextlib.redirect_stderr(err):
+            code = cli.main()
+        return SimpleNamespace(returncode=code, stdout=out.getvalue(), stderr=err.getvalue())
 
     def test_quiet_output_with_uncertainty(self):
         """Quiet mode should include uncertainty values when --activity-unc is used."""
@@ -96,6 +105,176 @@ class TestSecularEquilibriumCLI(unittest.TestCase):
             self.assertTrue(any(row['parent'] == 'U-238' and row['error'] == '' for row in rows))
             self.assertTrue(any('Invalid measured nuclide name' in row['error'] for row in rows))
 
+    def test_batch_csv_nuclide_error_precedes_uncertainty_error(self):
+        """Invalid nuclide names should be reported before a negative uncertainty."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_csv = os.path.join(tmpdir, 'input.csv')
+            output_csv = os.path.join(tmpdir, 'output.csv')
+
+            with open(input_csv, 'w', encoding='utf-8', newline='') as fh:
+                writer = csv.writer(fh)
+                writer.writerow([
+                    'measured_nuclide',
+                    'measured_activity',
+                    'parent_nuclides',
+                    'decay_type',
+                    'measured_activity_uncertainty',
+                ])
+                writer.writerow(['Invalid-999', '100', 'U-238', '', '-1'])
+                writer.writerow(['Pb-214', '100', 'U-238', '', '-1'])
+
+            proc = self._run_cli(['--input-csv', input_csv, '--output-csv', output_csv])
+            self.assertEqual(proc.returncode, 1)
+
+            with open(output_csv, 'r', encoding='utf-8', newline='') as fh:
+                rows = list(csv.DictReader(fh))
+
+            self.assertIn('Invalid measured nuclide name', rows[0]['error'])
+            self.assertEqual(rows[1]['error'], 'measured_activity_uncertainty must be >= 0')
+
+    def test_batch_csv_repeated_config_scales_with_activity(self):
+        """Rows sharing a nuclide configuration should scale linearly with activity."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_csv = os.path.join(tmpdir, 'input.csv')
+            with open(input_csv, 'w', encoding='utf-8', newline='') as fh:
+                writer = csv.writer(fh)
+                writer.writerow([
+                    'measured_nuclide',
+                    'measured_activity',
+                    'parent_nuclides',
+                    'measured_activity_uncertainty',
+                ])
+                writer.writerow(['Pb-214', '100', 'U-238', '5'])
+                writer.writerow(['Pb-214', '250', 'U-238', '5'])
+
+            proc = self._run_cli(['--input-csv', input_csv])
+            self.assertEqual(proc.returncode, 0, msg=proc.stderr)
+
+            rows = list(csv.DictReader(io.StringIO(proc.stdout)))
+            self.assertEqual(len(rows), 2)
+            self.assertAlmostEqual(
+                float(rows[1]['activity_Bq']) / float(rows[0]['activity_Bq']), 2.5, places=10
+            )
+            self.assertAlmostEqual(float(rows[0]['relative_uncertainty']), 0.05, places=10)
+            self.assertAlmostEqual(float(rows[1]['relative_uncertainty']), 0.02, places=10)
+            self.assertEqual(rows[0]['mass_uncertainty_g'], rows[1]['mass_uncertainty_g'])
+
+    def test_batch_csv_parallel_jobs_match_serial(self):
+        """Batch output with worker processes should match serial output."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_csv = os.path.join(tmpdir, 'input.csv')
+            with open(input_csv, 'w', encoding='utf-8', newline='') as fh:
+                writer = csv.writer(fh)
+                writer.writerow(['measured_nuclide', 'measured_activity', 'parent_nuclides'])
+                writer.writerow(['Pb-214', '100', 'U-238;Ra-226'])
+                writer.writerow(['Bi-212', '50', 'Th-232'])
+                writer.writerow(['Invalid-999', '100', 'U-238'])
+
+            serial = self._run_cli(['--input-csv', input_csv])
+            parallel = self._run_cli(['--input-csv', input_csv, '--jobs', '2'])
+
+            self.assertEqual(parallel.returncode, serial.returncode)
+            self.assertEqual(parallel.stdout, serial.stdout)
+
+    def test_batch_csv_jobs_solve_each_config_once(self):
+        """Worker processes should solve each configuration once across input chunks."""
+        submitted = []
+
+        class RecordingExecutor:
+            def __init__(self, max_workers):
+                pass
+
+            def map(self, fn, configs, chunksize=1):
+                submitted.extend(configs)
+                return map(fn, configs)
+
+            def shutdown(self):
+                pass
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_csv = os.path.join(tmpdir, 'input.csv')
+            with open(input_csv, 'w', encoding='utf-8', newline='') as fh:
+                writer = csv.writer(fh)
+                writer.writerow(['measured_nuclide', 'measured_activity', 'parent_nuclides'])
+                for activity in range(1, 5):
+                    writer.writerow(['Pb-214', activity, 'U-238'])
+                    writer.writerow(['Bi-212', activity, 'Th-232'])
+                    writer.writerow(['Pb-210', activity, 'Ra-226'])
+
+            with patch.object(cli, 'ProcessPoolExecutor', RecordingExecutor), \
+                    patch.object(cli, '_BATCH_CHUNK_ROWS', 4):
+                proc = self._run_cli(['--input-csv', input_csv, '--jobs', '2'])
+
+        self.assertEqual(proc.returncode, 0, msg=proc.stderr)
+        self.assertEqual(len(list(csv.DictReader(io.StringIO(proc.stdout)))), 12)
+        self.assertEqual(len(submitted), 3)
+
+    def test_batch_csv_reordered_columns_and_short_rows(self):
+        """Input columns should be matched by header name; missing trailing fields are blank."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_csv = os.path.join(tmpdir, 'input.csv')
+            with open(input_csv, 'w', encoding='utf-8', newline='') as fh:
+                fh.write('parent_nuclides,measured_activity,measured_nuclide\n')
+                fh.write('U-238,100,Pb-214,ignored\n')
+                fh.write('\n')
+                fh.write('Th-232,50\n')
+
+            proc = self._run_cli(['--input-csv', input_csv])
+            self.assertEqual(proc.returncode, 1)
+
+            rows = list(csv.DictReader(io.StringIO(proc.stdout)))
+            self.assertEqual(len(rows), 2)
+            self.assertEqual(rows[0]['measured_nuclide'], 'Pb-214')
+            self.assertEqual(rows[0]['parent'], 'U-238')
+            self.assertEqual(rows[0]['error'], '')
+            self.assertEqual(rows[1]['input_row'], '3')
+            self.assertIn('measured_nuclide is empty', rows[1]['error'])
+
+    def test_batch_csv_from_stdin(self):
+        """--input-csv - should read the batch CSV from stdin."""
+        input_text = 'measured_nuclide,measured_activity,parent_nuclides\nPb-214,100,U-238\n'
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_csv = os.path.join(tmpdir, 'input.csv')
+            with open(input_csv, 'w', encoding='utf-8', newline='') as fh:
+                fh.write(input_text)
+            from_file = self._run_cli(['--input-csv', input_csv])
+
+        with patch.object(sys, 'stdin', io.StringIO(input_text, newline='')):
+            from_stdin = self._run_cli(['--input-csv', '-'])
+
+        self.assertEqual(from_stdin.returncode, 0, msg=from_stdin.stderr)
+        self.assertEqual(from_stdin.stdout, from_file.stdout)
+
+    def test_batch_csv_without_stdin(self):
+        """--input-csv - should report a clear error when stdin is unavailable."""
+        with patch.object(sys, 'stdin', None):
+            proc = self._run_cli(['--input-csv', '-'])
+
+        self.assertEqual(proc.returncode, 1)
+        self.assertIn('stdin is not available for --input-csv -', proc.stderr)
+
+    def test_batch_csv_precision(self):
+        """--precision should control the float format of batch numeric columns."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_csv = os.path.join(tmpdir, 'input.csv')
+            with open(input_csv, 'w', encoding='utf-8', newline='') as fh:
+                writer = csv.writer(fh)
+                writer.writerow(['measured_nuclide', 'measured_activity', 'parent_nuclides'])
+                writer.writerow(['Pb-214', '100', 'U-238'])
+
+            rows = {}
+            for precision in ('full', 'short', 'repr'):
+                proc = self._run_cli(['--input-csv', input_csv, '--precision', precision])
+                self.assertEqual(proc.returncode, 0, msg=proc.stderr)
+                rows[precision] = next(csv.DictReader(io.StringIO(proc.stdout)))
+
+            self.assertRegex(rows['full']['mass_g'], r'^\d\.\d{12}e[+-]\d+$')
+            self.assertRegex(rows['short']['mass_g'], r'^\d\.\d{6}e[+-]\d+$')
+            self.assertEqual(repr(float(rows['repr']['mass_g'])), rows['repr']['mass_g'])
+            self.assertAlmostEqual(
+                float(rows['repr']['mass_g']) / float(rows['full']['mass_g']), 1.0, places=11
+            )
+
 
 if __name__ == '__main__':
     unittest.main()